@@ -1,10 +1,194 @@
 import hashlib
-import json
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from time import time
 from urllib.parse import ParseResult, urlparse
 
+import ijson
+import orjson
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+
+try:
+    from pow_numba import find_proof as _find_proof_numba
+except ImportError:  # Numba is optional; the hashlib loop still works without it
+    _find_proof_numba = None
+
+try:
+    from pow_cuda import find_proof as _find_proof_cuda
+except ImportError:  # No CUDA device or toolkit; CPU paths still work
+    _find_proof_cuda = None
+
+# Shared session so requests to neighbor nodes reuse pooled keep-alive
+# connections instead of opening a fresh one per call
+_session = requests.Session()
+_session.mount(prefix="http://", adapter=HTTPAdapter(pool_maxsize=32))
+
+# Mining difficulty: number of leading hex zeroes a valid proof's hash
+# must have. A digest has that prefix exactly when its first 8 bytes,
+# read as a big-endian integer, shift down to zero - one shift and one
+# compare regardless of the difficulty value (up to 16).
+DIFFICULTY: int = 4
+
+
+def _make_prefix_checker(difficulty: int):
+    """
+    Builds a digest checker specialized for one difficulty value
+
+    The shift amount and the bound method lookups are baked into the
+    closure once, so the hot loops call a function whose constants were
+    all resolved at build time instead of re-deriving them per digest.
+
+    Parameters:
+        difficulty (int): Number of leading hex zeroes required
+
+    Returns:
+        Callable[[bytes], bool]: True if the digest meets the difficulty
+    """
+    shift: int = 64 - 4 * difficulty
+
+    def check_prefix(
+        digest: bytes, _shift: int = shift, _from_bytes=int.from_bytes
+    ) -> bool:
+        return _from_bytes(digest[:8], "big") >> _shift == 0
+
+    return check_prefix
+
+
+# Specialized once at import for the configured difficulty
+_check_prefix = _make_prefix_checker(difficulty=DIFFICULTY)
+
+# Number of processes to mine with; the search is embarrassingly parallel,
+# so each worker scans a disjoint stripe of the nonce space. Opt-in via the
+# environment because process startup only pays off if a single search
+# takes longer than roughly the fork overhead.
+POW_WORKERS: int = int(os.environ.get("POW_WORKERS", "1"))
+
+# Candidates a worker tries between checks of the shared found flag
+_POW_BATCH: int = 1 << 14
+
+
+def _advance_ascii(digits: bytearray, step: int) -> None:
+    """
+    Adds step to the decimal number held as ASCII digits, in place
+
+    Small steps usually only rewrite the trailing digit, so the mining
+    loops can reuse one buffer instead of formatting every nonce from
+    scratch; the buffer grows at the front when the carry overflows.
+
+    Parameters:
+        digits (bytearray): ASCII decimal digits to advance
+        step (int): Non-negative amount to add
+
+    Returns:
+        None
+    """
+    position: int = len(digits) - 1
+    carry: int = step
+
+    while position >= 0 and carry:
+        carry, digit = divmod(digits[position] - 0x30 + carry, 10)
+        digits[position] = 0x30 + digit
+        position -= 1
+
+    # Prepend any remaining carry, least significant digit first
+    while carry:
+        carry, digit = divmod(carry, 10)
+        digits[:0] = bytes((0x30 + digit,))
+
+
+def _search_stripe(last_proof: int, start: int, stride: int, found) -> None:
+    """
+    Mines the nonce stripe start, start + stride, ... in one worker
+
+    Runs in a child process; scans candidates in batches and checks the
+    shared flag between batches so all workers stop soon after any one
+    of them finds a valid proof.
+
+    Parameters:
+        last_proof (int): Previous Proof (p)
+        start (int): First candidate nonce of this worker's stripe
+        stride (int): Step between candidates (the worker count)
+        found (Synchronized): Shared winning proof, -1 while unset
+
+    Returns:
+        None
+    """
+    proof: int = start
+    prefix_hash = hashlib.sha256(string=str(last_proof).encode())
+
+    # Reusable ASCII nonce buffer for the hashlib path, advanced in place
+    candidate: int = start
+    digits = bytearray(b"%d" % start)
+
+    while found.value == -1:
+        # The compiled kernel hard-codes the default difficulty
+        if _find_proof_numba is not None and DIFFICULTY == 4:
+            # Let the compiled kernel scan one bounded batch of the stripe
+            result: int = int(
+                _find_proof_numba(last_proof, proof, stride, _POW_BATCH)
+            )
+
+            if result >= 0:
+                with found.get_lock():
+                    if found.value == -1:
+                        found.value = result
+                return
+        else:
+            # hashlib fallback over the same batch of candidates
+            for _ in range(_POW_BATCH):
+                guess_hash = prefix_hash.copy()
+                guess_hash.update(digits)
+
+                if _check_prefix(guess_hash.digest()):
+                    with found.get_lock():
+                        if found.value == -1:
+                            found.value = candidate
+                    return
+
+                candidate += stride
+                _advance_ascii(digits=digits, step=stride)
+
+        proof += _POW_BATCH * stride
+
+
+def _find_proof_parallel(last_proof: int, workers: int) -> int:
+    """
+    Searches for a proof with one striped worker process per core
+
+    The first worker to find a valid proof publishes it through a shared
+    value; the others notice and stop after their current batch.
+
+    Parameters:
+        last_proof (int): Previous Proof (p)
+        workers (int): Number of worker processes to spawn
+
+    Returns:
+        int: New Proof (p')
+    """
+    found = multiprocessing.Value("q", -1)
+
+    processes: list[multiprocessing.Process] = [
+        multiprocessing.Process(
+            target=_search_stripe,
+            args=(last_proof, offset, workers, found),
+            daemon=True,
+        )
+        for offset in range(workers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join()
+
+    return found.value
+
 
 TransactionDict = dict[str, str | int]  # Dict representation of a transaction
 BlockDict = dict[
@@ -12,6 +196,29 @@ BlockDict = dict[
 ]  # Dict representation of a block
 
 
+def _transaction_bytes(sender: str, recipient: str, amount: int) -> bytes:
+    """
+    Serializes one transaction's fields to canonical JSON bytes
+
+    Parameters:
+        sender (str): Address of the sender
+        recipient (str): Address of the recipient
+        amount (int): Transaction amount
+
+    Returns:
+        bytes: Canonical JSON representation of the transaction
+    """
+    return (
+        b'{"amount":'
+        + str(amount).encode()
+        + b',"recipient":"'
+        + recipient.encode()
+        + b'","sender":"'
+        + sender.encode()
+        + b'"}'
+    )
+
+
 class Transaction:
     """
     Transaction class
@@ -22,6 +229,9 @@ class Transaction:
         amount (int): Transaction amount
     """
 
+    # No per-instance __dict__; transactions are numerous and tiny
+    __slots__ = ("sender", "recipient", "amount")
+
     def __init__(self, sender: str, recipient: str, amount: int) -> None:
         """
         Initializes a new transaction
@@ -51,24 +261,61 @@ class Transaction:
             "amount": self.amount,
         }
 
+    def canonical_bytes(self) -> bytes:
+        """
+        Serializes the transaction to canonical JSON bytes for hashing
+
+        Returns:
+            bytes: Canonical JSON representation of the transaction
+        """
+        return _transaction_bytes(
+            sender=self.sender, recipient=self.recipient, amount=self.amount
+        )
+
 
 class Block:
     """
     Block class
 
+    Transactions are stored as three parallel columns (senders,
+    recipients, amounts) rather than a list of Transaction objects, so
+    serialization and hashing walk contiguous arrays instead of chasing
+    per-transaction objects. The columns are sealed into exact-size
+    tuples at construction: a mined block never changes, tuples carry no
+    list over-allocation slack, and immutability protects the memoized
+    hash and JSON from accidental invalidation.
+
     Attributes:
         index (int): Index of the block
         timestamp (int): Timestamp
-        transactions (list[Transaction]): List of transactions in the block
+        senders (tuple[str, ...]): Sender address of each transaction
+        recipients (tuple[str, ...]): Recipient address of each transaction
+        amounts (tuple[int, ...]): Amount of each transaction
         proof (int): Proof of work
         previous_hash (str): Hash of the previous block
     """
 
+    # No per-instance __dict__; attribute reads become fixed-offset loads
+    __slots__ = (
+        "index",
+        "timestamp",
+        "senders",
+        "recipients",
+        "amounts",
+        "proof",
+        "previous_hash",
+        "_hash",
+        "_merkle_root",
+        "_cached_json",
+    )
+
     def __init__(
         self,
         index: int,
         timestamp: float,
-        transactions: list[Transaction],
+        senders: list[str],
+        recipients: list[str],
+        amounts: list[int],
         proof: int,
         previous_hash: str,
     ) -> None:
@@ -78,7 +325,9 @@ class Block:
         Parameters:
             index (int): Index of the block
             timestamp (int): Timestamp
-            transactions (list[Transaction]): List of transactions in the block
+            senders (list[str]): Sender address of each transaction
+            recipients (list[str]): Recipient address of each transaction
+            amounts (list[int]): Amount of each transaction
             proof (int): Proof of work
             previous_hash (str): Hash of the previous block
 
@@ -87,11 +336,35 @@ class Block:
         """
         self.index: int = index  # Index of the block
         self.timestamp: float = timestamp  # Timestamp
-        self.transactions: list[Transaction] = (
-            transactions  # List of transactions in the block
-        )
+
+        # Seal the columns; see the class docstring
+        self.senders: tuple[str, ...] = tuple(senders)
+        self.recipients: tuple[str, ...] = tuple(recipients)
+        self.amounts: tuple[int, ...] = tuple(amounts)
         self.proof: int = proof  # Proof of work
         self.previous_hash: str = previous_hash  # Hash of the previous block
+        self._hash: str | None = None  # Cached hash; a block never mutates
+        self._merkle_root: str | None = None  # Cached Merkle root
+        self._cached_json: bytes | None = None  # Cached JSON serialization
+
+    @property
+    def transactions(self) -> list[Transaction]:
+        """
+        Returns the block's transactions as Transaction views
+
+        Convenience accessor that materializes Transaction objects from
+        the underlying columns; the hot paths (hashing, serialization)
+        read the columns directly instead.
+
+        Returns:
+            list[Transaction]: List of transactions in the block
+        """
+        return [
+            Transaction(sender=sender, recipient=recipient, amount=amount)
+            for sender, recipient, amount in zip(
+                self.senders, self.recipients, self.amounts
+            )
+        ]
 
     def to_dict(self) -> BlockDict:
         """
@@ -104,25 +377,178 @@ class Block:
             "index": self.index,
             "timestamp": self.timestamp,
             "transactions": [
-                transaction.to_dict() for transaction in self.transactions
+                {"sender": sender, "recipient": recipient, "amount": amount}
+                for sender, recipient, amount in zip(
+                    self.senders, self.recipients, self.amounts
+                )
             ],
             "proof": self.proof,
             "previous_hash": self.previous_hash,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Converts the block to JSON bytes, memoizing the result
+
+        Historical blocks never change, so each block is serialized at
+        most once no matter how often the chain is served.
+
+        Returns:
+            bytes: JSON representation of the block
+        """
+        if self._cached_json is None:
+            self._cached_json = orjson.dumps(self.to_dict())
+
+        return self._cached_json
+
+    @property
+    def merkle_root(self) -> str:
+        """
+        Returns the Merkle root of the block's transactions
+
+        Transaction digests are pair-hashed level by level until a single
+        root remains; an odd node is paired with itself. The root commits
+        to every transaction, so the block header can be hashed without
+        re-serializing the transaction list. Computed once and cached.
+
+        Returns:
+            str: Hex Merkle root of the transactions
+        """
+        if self._merkle_root is None:
+            # Hash each transaction's canonical bytes to form the leaves,
+            # reading the columns directly in one pass
+            digests: list[bytes] = [
+                hashlib.sha256(
+                    string=_transaction_bytes(
+                        sender=sender, recipient=recipient, amount=amount
+                    )
+                ).digest()
+                for sender, recipient, amount in zip(
+                    self.senders, self.recipients, self.amounts
+                )
+            ]
+
+            # An empty block commits to the hash of the empty string
+            if not digests:
+                digests = [hashlib.sha256(string=b"").digest()]
+
+            # Pair-hash until a single root remains
+            while len(digests) > 1:
+                if len(digests) % 2:
+                    digests.append(digests[-1])
+
+                digests = [
+                    hashlib.sha256(string=digests[i] + digests[i + 1]).digest()
+                    for i in range(0, len(digests), 2)
+                ]
+
+            self._merkle_root = digests[0].hex()
+
+        return self._merkle_root
+
+    def header_bytes(self) -> bytes:
+        """
+        Serializes the fixed-size block header to canonical JSON bytes
+
+        The header carries the Merkle root instead of the transaction
+        list, so hashing a block costs the same no matter how many
+        transactions it holds.
+
+        Returns:
+            bytes: Canonical JSON representation of the block header
+        """
+        return (
+            b'{"index":'
+            + str(self.index).encode()
+            + b',"merkle_root":"'
+            + self.merkle_root.encode()
+            + b'","previous_hash":"'
+            + self.previous_hash.encode()
+            + b'","proof":'
+            + str(self.proof).encode()
+            + b',"timestamp":'
+            + str(self.timestamp).encode()
+            + b"}"
+        )
+
+    @property
+    def header_hash(self) -> str:
+        """
+        Returns the SHA-256 hash of the block header, memoized
+
+        The digest is computed on first access and then reused, so a
+        block is hashed at most once no matter how many validate_chain
+        or consensus rounds look at it; blocks rebuilt from the wire get
+        their hash populated during their first validation.
+
+        Returns:
+            str: Hash of the block header
+        """
+        if self._hash is None:
+            self._hash = hashlib.sha256(string=self.header_bytes()).hexdigest()
+
+        return self._hash
+
+    @classmethod
+    def from_dict(cls, block_dict: BlockDict) -> "Block":
+        """
+        Builds a Block from its dictionary representation
+
+        Used to rebuild Block objects from chains received over the wire.
+
+        Parameters:
+            block_dict (BlockDict): Dictionary representation of a block
+
+        Returns:
+            Block: The reconstructed block
+        """
+        # Split the transaction dicts into the three columns
+        senders: list[str] = []
+        recipients: list[str] = []
+        amounts: list[int] = []
+
+        for transaction in block_dict["transactions"]:  # type: ignore
+            senders.append(transaction["sender"])
+            recipients.append(transaction["recipient"])
+            amounts.append(transaction["amount"])
+
+        return cls(
+            index=block_dict["index"],  # type: ignore
+            # Coerced so parsers that hand back Decimal (or int, for a
+            # whole-second timestamp) cannot break re-serialization
+            timestamp=float(block_dict["timestamp"]),  # type: ignore
+            senders=senders,
+            recipients=recipients,
+            amounts=amounts,
+            proof=block_dict["proof"],  # type: ignore
+            previous_hash=block_dict["previous_hash"],  # type: ignore
+        )
+
 
 class Blockchain:
     """
     Blockchain class
 
+    Pending transactions live in three parallel columns that move into
+    the next block wholesale when it is mined.
+
     Attributes:
         chain (list[Block]): List of blocks
-        current_transactions (list[Transaction]): List of transactions
+        current_transactions (list[Transaction]): Pending transactions
     """
 
     def __init__(self) -> None:
         self.chain: list[Block] = []  # List of blocks
-        self.current_transactions: list[Transaction] = []  # List of transactions
+
+        # Pending transactions, one entry per column
+        self._tx_senders: list[str] = []
+        self._tx_recipients: list[str] = []
+        self._tx_amounts: list[int] = []
+
+        # Guards chain and pending-transaction mutation when the server
+        # runs with threaded workers; a transaction spans three column
+        # appends, which must not interleave with a block being sealed
+        self._lock = threading.Lock()
 
         # Create the genesis block
         self.new_block(proof=100, previous_hash="1")
@@ -130,6 +556,21 @@ class Blockchain:
         # Collection of unordered unique nodes
         self.nodes: set[str] = set()
 
+    @property
+    def current_transactions(self) -> list[Transaction]:
+        """
+        Returns the pending transactions as Transaction views
+
+        Returns:
+            list[Transaction]: List of pending transactions
+        """
+        return [
+            Transaction(sender=sender, recipient=recipient, amount=amount)
+            for sender, recipient, amount in zip(
+                self._tx_senders, self._tx_recipients, self._tx_amounts
+            )
+        ]
+
     def new_block(self, proof: int, previous_hash: str | None = None) -> Block:
         """
         Creates a new block in the blockchain
@@ -141,20 +582,25 @@ class Blockchain:
         Returns:
             Block: The new block
         """
-        # Create a new block
-        block = Block(
-            index=len(self.chain) + 1,
-            timestamp=time(),
-            transactions=self.current_transactions,
-            proof=proof,
-            previous_hash=previous_hash or self.hash(block=self.chain[-1]),
-        )
-
-        # Reset the current list of transactions
-        self.current_transactions = []
-
-        # Add the block to the chain
-        self.chain.append(block)
+        with self._lock:
+            # Create a new block; the pending columns are sealed into it
+            block = Block(
+                index=len(self.chain) + 1,
+                timestamp=time(),
+                senders=self._tx_senders,
+                recipients=self._tx_recipients,
+                amounts=self._tx_amounts,
+                proof=proof,
+                previous_hash=previous_hash or self.hash(block=self.chain[-1]),
+            )
+
+            # Reset the pending transaction columns
+            self._tx_senders = []
+            self._tx_recipients = []
+            self._tx_amounts = []
+
+            # Add the block to the chain
+            self.chain.append(block)
 
         # Return the new block
         return block
@@ -171,14 +617,14 @@ class Blockchain:
         Returns:
             int: The index of the Block that will hold this transaction
         """
-        # Create a new transaction
-        transaction = Transaction(sender=sender, recipient=recipient, amount=amount)
-
-        # Add the new transaction to the list of transactions
-        self.current_transactions.append(transaction)
+        with self._lock:
+            # Append the new transaction to the pending columns
+            self._tx_senders.append(sender)
+            self._tx_recipients.append(recipient)
+            self._tx_amounts.append(amount)
 
-        # Returns the index of the block that will hold this transaction
-        return self.last_block.index + 1
+            # Returns the index of the block that will hold this transaction
+            return self.last_block.index + 1
 
     def proof_of_work(self, last_proof: int) -> int:
         """
@@ -192,12 +638,47 @@ class Blockchain:
         Returns:
             int: New Proof (p')
         """
+        # Try the GPU first: thousands of hash trials per kernel launch.
+        # The kernel hard-codes the default difficulty.
+        if _find_proof_cuda is not None and DIFFICULTY == 4:
+            return _find_proof_cuda(last_proof)
+
+        # Fan the search out across worker processes when configured;
+        # each one scans a disjoint nonce stripe
+        if POW_WORKERS > 1:
+            return _find_proof_parallel(last_proof=last_proof, workers=POW_WORKERS)
+
+        # Prefer the Numba-compiled search; it runs the whole loop as
+        # machine code with no per-nonce interpreter overhead. The kernel
+        # hard-codes the default difficulty.
+        if _find_proof_numba is not None and DIFFICULTY == 4:
+            return int(_find_proof_numba(last_proof))
+
         proof: int = 0
 
-        while self.validate_proof(last_proof=last_proof, proof=proof) is False:
-            proof += 1
+        # The guess is always the digits of last_proof followed by the digits
+        # of the nonce, so hash the constant prefix once and reuse the
+        # resulting midstate with .copy(); each attempt then only feeds the
+        # nonce digits into a copy instead of re-hashing the prefix. hashlib
+        # dispatches to OpenSSL, which already uses the CPU's SHA extensions
+        # when they are available.
+        prefix_hash = hashlib.sha256(string=str(last_proof).encode())
 
-        return proof
+        # Reusable ASCII nonce buffer advanced in place; an increment
+        # usually only rewrites the trailing digit, so no per-attempt
+        # formatting or allocation remains in the loop
+        digits = bytearray(b"0")
+
+        while True:
+            guess_hash = prefix_hash.copy()
+            guess_hash.update(digits)
+
+            # Difficulty prefix check on raw bytes; see validate_proof
+            if _check_prefix(guess_hash.digest()):
+                return proof
+
+            proof += 1
+            _advance_ascii(digits=digits, step=1)
 
     def register_node(self, address: str) -> None:
         """
@@ -209,25 +690,48 @@ class Blockchain:
         Returns:
             None
         """
+        # Fast path for the common http://host:port form: drop the scheme
+        # and cut the authority where a path, query or fragment starts,
+        # skipping the full URL state machine
+        scheme_end: int = address.find("://")
+
+        if scheme_end >= 0:
+            authority: str = address[scheme_end + 3 :]
+
+            for separator in ("/", "?", "#"):
+                authority = authority.split(separator, 1)[0]
+
+            if "@" not in authority:
+                self.nodes.add(authority)
+                return
+
+        # Fall back to urlparse for unusual addresses (credentials in the
+        # URL, missing scheme, ...), matching the original behavior
         parsed_url: ParseResult = urlparse(url=address)
         self.nodes.add(parsed_url.netloc)
 
-    def validate_chain(self, chain: list[Block]) -> bool:
+    def validate_chain(self, chain: Iterable[Block]) -> bool:
         """
         Determine if a given blockchain is valid
 
+        Consumes the chain one block at a time, so it works on a list as
+        well as on a stream of blocks still being parsed off the wire;
+        only the previous block is kept around.
+
         Parameters:
-            chain (list[Block]): A blockchain
+            chain (Iterable[Block]): A blockchain
 
         Returns:
             bool: True if valid, False if not
         """
-        last_block: Block = chain[0]  # Starting with the genesis block
-        current_index: int = 1
+        blocks: Iterator[Block] = iter(chain)
 
-        while current_index < len(chain):
-            block: Block = chain[current_index]
+        # Starting with the genesis block; an empty chain is invalid
+        last_block: Block | None = next(blocks, None)
+        if last_block is None:
+            return False
 
+        for block in blocks:
             # Check if the hash of the block is correct
             if block.previous_hash != self.hash(block=last_block):
                 return False
@@ -237,7 +741,6 @@ class Blockchain:
                 return False
 
             last_block = block
-            current_index += 1
 
         return True
 
@@ -257,27 +760,69 @@ class Blockchain:
         # Get the length of the blockchain
         max_length: int = len(self.chain)
 
-        # Loop through all the nodes
-        for node in neighbors:
-            # Send a request to /chain of each node
-            response: Response = requests.get(url=f"http://{node}/chain")
-
-            if response.status_code == 200:
-                # Length of the blockchain of this node
-                length: int = response.json()["length"]
-
-                # The blockchain of this node
-                chain: list[Block] = response.json()["chain"]
-
-                # Check if this chain is longer than the current one and if it's valid;
-                # Then replace the current chain with this node's chain
-                if length > max_length and self.validate_chain(chain=chain):
-                    max_length = length
-                    new_chain = chain
+        if not neighbors:
+            return False
+
+        # Fetch every neighbor's chain concurrently; the wait collapses
+        # from the sum of the round trips to the slowest single one
+        with ThreadPoolExecutor(max_workers=min(32, len(neighbors))) as executor:
+            # Send a request to /chain of each node, streaming the body so
+            # the full JSON document is never held in memory at once
+            futures: list[Future[Response]] = [
+                executor.submit(
+                    _session.get, f"http://{node}/chain", timeout=5, stream=True
+                )
+                for node in neighbors
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    response: Response = future.result()
+                except requests.RequestException:
+                    # Skip nodes that are unreachable or time out
+                    continue
+
+                with response:
+                    if response.status_code != 200:
+                        continue
+
+                    # The blockchain of this node, rebuilt block by block
+                    # as the response is parsed; the list fills up while
+                    # validate_chain consumes the same stream, so invalid
+                    # chains stop being downloaded at the first bad block
+                    chain: list[Block] = []
+
+                    def _stream_blocks(
+                        raw=response.raw, chain=chain
+                    ) -> Iterator[Block]:
+                        # use_float keeps fractional numbers as float;
+                        # ijson's default Decimal would poison adopted
+                        # timestamps, which orjson refuses to serialize
+                        for block_dict in ijson.items(
+                            raw, "chain.item", use_float=True
+                        ):
+                            block = Block.from_dict(block_dict=block_dict)
+                            chain.append(block)
+                            yield block
+
+                    # Check if this chain is valid and longer than the
+                    # current one; the length is counted from the streamed
+                    # blocks rather than trusting the advertised field
+                    try:
+                        if (
+                            self.validate_chain(chain=_stream_blocks())
+                            and len(chain) > max_length
+                        ):
+                            max_length = len(chain)
+                            new_chain = chain
+                    except ijson.JSONError:
+                        # Skip nodes that return malformed JSON
+                        continue
 
         # If there is a new chain, replace the current chain
         if new_chain:
-            self.chain = new_chain
+            with self._lock:
+                self.chain = new_chain
             return True
 
         return False
@@ -293,9 +838,9 @@ class Blockchain:
         Returns:
             str: Hash of the block
         """
-        # Make sure the dictionary is ordered, or we'll have inconsistent hashes
-        block_string: bytes = json.dumps(obj=block.to_dict(), sort_keys=True).encode()
-        return hashlib.sha256(string=block_string).hexdigest()
+        # Only the fixed-size header is hashed; the Merkle root inside it
+        # commits to the transactions. The block memoizes its own digest
+        return block.header_hash
 
     @staticmethod
     def validate_proof(last_proof: int, proof: int) -> bool:
@@ -312,11 +857,13 @@ class Blockchain:
         # Encode the last proof and the current proof
         guess: bytes = f"{last_proof}{proof}".encode()
 
-        # Hash the guess with SHA-256
-        guess_hash: str = hashlib.sha256(string=guess).hexdigest()
+        # Hash the guess with SHA-256, keeping the raw digest; building
+        # the 64-char hex string just to look at 4 characters would
+        # allocate a throwaway str per call
+        digest: bytes = hashlib.sha256(string=guess).digest()
 
-        # Check if the guess hash has 4 leading zeroes
-        return guess_hash[:4] == "0000"
+        # Check the leading DIFFICULTY hex zeroes with the specialized checker
+        return _check_prefix(digest)
 
     @property
     def last_block(self) -> Block:
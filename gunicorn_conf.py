@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the blockchain server.
+
+Run with:
+    gunicorn -c gunicorn_conf.py server:app
+
+Threaded workers let a long /mine request overlap with /chain,
+/transactions/new and consensus rounds instead of serializing behind
+the dev server's single thread.
+
+Caveat: every worker process forks its own Blockchain instance.
+preload_app makes them start from the same genesis block, but state
+diverges as blocks are mined; sharing one chain across processes needs
+an external store (e.g. Redis) and is out of scope here. Use a single
+worker (or the waitress path in server.py) when one coherent chain per
+node matters.
+
+The background miner is not started at import: threads do not survive
+fork(), so a miner started in the preloading master would be dead in
+every worker. Each worker starts its own miner on its first /mine
+request instead (see _ensure_miner in server.py).
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+workers = multiprocessing.cpu_count() * 2
+worker_class = "gthread"
+threads = 4
+preload_app = True
@@ -0,0 +1,203 @@
+"""
+CUDA-parallel Proof of Work search.
+
+The nonce search is embarrassingly parallel: every candidate is an
+independent hash trial. This module launches batches of trials across
+thousands of GPU threads with numba.cuda, each thread formatting and
+hashing its own nonce and publishing a hit with an atomic min, so the
+smallest valid proof in a batch wins deterministically.
+
+Importing this module raises ImportError when no CUDA device is
+available; callers treat the GPU path as optional.
+"""
+
+import numpy as np
+from numba import cuda, int64, uint8
+
+if not cuda.is_available():
+    raise ImportError("CUDA is not available on this machine")
+
+# SHA-256 round constants (FIPS 180-4); read by the kernel as constants
+_K = np.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5,
+        0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3,
+        0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC,
+        0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7,
+        0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13,
+        0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3,
+        0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5,
+        0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208,
+        0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=np.int64,
+)
+
+_MASK32 = 0xFFFFFFFF  # Keep int64 arithmetic wrapped to 32 bits
+
+# No proof found yet; atomic.min pulls any real nonce below this
+_SENTINEL = np.int64(2**62)
+
+# Launch geometry: nonces tried per kernel launch
+_THREADS_PER_BLOCK = 256
+_BLOCKS_PER_GRID = 4096
+_BATCH = _THREADS_PER_BLOCK * _BLOCKS_PER_GRID
+
+
+@cuda.jit(device=True)
+def _rotr(x: int, r: int) -> int:
+    """
+    Rotates a 32-bit value right by r bits
+
+    Parameters:
+        x (int): 32-bit value
+        r (int): Rotation amount
+
+    Returns:
+        int: Rotated 32-bit value
+    """
+    return ((x >> r) | (x << (32 - r))) & _MASK32
+
+
+@cuda.jit(device=True)
+def _write_digits(buf, pos: int, n: int) -> int:
+    """
+    Writes the decimal digits of n into buf starting at pos
+
+    Parameters:
+        buf: Per-thread byte buffer to write into
+        pos (int): Offset to start writing at
+        n (int): Non-negative integer to format
+
+    Returns:
+        int: Offset just past the last digit written
+    """
+    if n == 0:
+        buf[pos] = 0x30
+        return pos + 1
+
+    count = 0
+    m = n
+    while m > 0:
+        m //= 10
+        count += 1
+
+    end = pos + count
+    i = end - 1
+    while n > 0:
+        buf[i] = 0x30 + n % 10
+        n //= 10
+        i -= 1
+
+    return end
+
+
+@cuda.jit
+def _pow_kernel(last_proof: int, base_nonce: int, found) -> None:
+    """
+    Tries one nonce per thread and records any valid proof
+
+    Each thread formats last_proof followed by its own nonce, runs one
+    SHA-256 compression and, on a difficulty hit, atomically keeps the
+    smallest winning nonce in found[0].
+
+    Parameters:
+        last_proof (int): Previous Proof (p)
+        base_nonce (int): First nonce of this launch's batch
+        found: Single-element device array holding the winning nonce
+    """
+    nonce = base_nonce + cuda.grid(1)
+
+    # Build the padded 64-byte message block for this thread's nonce
+    block = cuda.local.array(64, uint8)
+    for i in range(64):
+        block[i] = 0
+
+    end = _write_digits(block, 0, last_proof)
+    end = _write_digits(block, end, nonce)
+    block[end] = 0x80
+
+    bit_length = end * 8
+    block[62] = (bit_length >> 8) & 0xFF
+    block[63] = bit_length & 0xFF
+
+    # Message schedule
+    w = cuda.local.array(64, int64)
+    for t in range(16):
+        w[t] = (
+            (int64(block[4 * t]) << 24)
+            | (int64(block[4 * t + 1]) << 16)
+            | (int64(block[4 * t + 2]) << 8)
+            | int64(block[4 * t + 3])
+        )
+
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> 3)
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> 10)
+        w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & _MASK32
+
+    # 64 rounds from the standard initial state
+    a = 0x6A09E667
+    b = 0xBB67AE85
+    c = 0x3C6EF372
+    d = 0xA54FF53A
+    e = 0x510E527F
+    f = 0x9B05688C
+    g = 0x1F83D9AB
+    h = 0x5BE0CD19
+
+    for t in range(64):
+        e1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g)
+        temp1 = (h + e1 + ch + _K[t] + w[t]) & _MASK32
+        e0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = (e0 + maj) & _MASK32
+
+        h = g
+        g = f
+        f = e
+        e = (d + temp1) & _MASK32
+        d = c
+        c = b
+        b = a
+        a = (temp1 + temp2) & _MASK32
+
+    # 4 leading hex zeroes means the top 16 bits of the digest are 0
+    if (((0x6A09E667 + a) & _MASK32) >> 16) == 0:
+        cuda.atomic.min(found, 0, nonce)
+
+
+def find_proof(last_proof: int) -> int:
+    """
+    Finds a proof p' such that hash(last_proof, p') has 4 leading hex zeroes
+
+    Launches the kernel over batches of nonces until a batch produces a
+    valid proof; the result is the smallest winner within that batch.
+
+    Parameters:
+        last_proof (int): Previous Proof (p)
+
+    Returns:
+        int: New Proof (p')
+    """
+    found = cuda.to_device(np.array([_SENTINEL], dtype=np.int64))
+    base_nonce = 0
+
+    while True:
+        _pow_kernel[_BLOCKS_PER_GRID, _THREADS_PER_BLOCK](
+            last_proof, base_nonce, found
+        )
+
+        result = int(found.copy_to_host()[0])
+        if result != _SENTINEL:
+            return result
+
+        base_nonce += _BATCH
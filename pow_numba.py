@@ -0,0 +1,213 @@
+"""
+Numba-compiled Proof of Work search.
+
+The mining loop in Blockchain.proof_of_work pays Python interpreter
+overhead on every nonce. This module compiles the whole search - ASCII
+formatting, SHA-256 and the difficulty check - to machine code with
+Numba, so a mining call is a single native loop with no per-nonce
+Python dispatch.
+
+The guess is always short enough (two decimal uint64s, at most 40
+bytes) to fit in a single padded SHA-256 block, so only one compression
+per nonce is ever needed.
+"""
+
+import numpy as np
+from numba import njit
+
+# SHA-256 round constants (FIPS 180-4)
+_K = np.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5,
+        0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3,
+        0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC,
+        0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7,
+        0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13,
+        0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3,
+        0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5,
+        0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208,
+        0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=np.int64,
+)
+
+# SHA-256 initial hash values (FIPS 180-4)
+_H = np.array(
+    [
+        0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+        0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19,
+    ],
+    dtype=np.int64,
+)
+
+_MASK32 = 0xFFFFFFFF  # Keep int64 arithmetic wrapped to 32 bits
+
+
+@njit(cache=True, nogil=True)
+def _rotr(x: int, r: int) -> int:
+    """
+    Rotates a 32-bit value right by r bits
+
+    Parameters:
+        x (int): 32-bit value
+        r (int): Rotation amount
+
+    Returns:
+        int: Rotated 32-bit value
+    """
+    return ((x >> r) | (x << (32 - r))) & _MASK32
+
+
+@njit(cache=True, nogil=True)
+def _write_digits(buf: np.ndarray, pos: int, n: int) -> int:
+    """
+    Writes the decimal digits of n into buf starting at pos
+
+    Manual digit extraction keeps the formatting inside compiled code;
+    Numba cannot optimize Python str operations.
+
+    Parameters:
+        buf (np.ndarray): Byte buffer to write into
+        pos (int): Offset to start writing at
+        n (int): Non-negative integer to format
+
+    Returns:
+        int: Offset just past the last digit written
+    """
+    if n == 0:
+        buf[pos] = 0x30
+        return pos + 1
+
+    # Count the digits to find the end of the field
+    count = 0
+    m = n
+    while m > 0:
+        m //= 10
+        count += 1
+
+    # Write the digits backwards from the end
+    end = pos + count
+    i = end - 1
+    while n > 0:
+        buf[i] = 0x30 + n % 10
+        n //= 10
+        i -= 1
+
+    return end
+
+
+@njit(cache=True, nogil=True)
+def _sha256_first_word(block: np.ndarray) -> int:
+    """
+    Runs one SHA-256 compression over a padded 64-byte block
+
+    Only the first word of the digest is needed to test the difficulty
+    prefix, so the remaining seven words are never materialized.
+
+    Parameters:
+        block (np.ndarray): Padded 64-byte message block
+
+    Returns:
+        int: First 32-bit big-endian word of the digest
+    """
+    # Build the message schedule
+    w = np.empty(64, dtype=np.int64)
+
+    for t in range(16):
+        w[t] = (
+            (np.int64(block[4 * t]) << 24)
+            | (np.int64(block[4 * t + 1]) << 16)
+            | (np.int64(block[4 * t + 2]) << 8)
+            | np.int64(block[4 * t + 3])
+        )
+
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> 3)
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> 10)
+        w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & _MASK32
+
+    # Run the 64 rounds
+    a, b, c, d = _H[0], _H[1], _H[2], _H[3]
+    e, f, g, h = _H[4], _H[5], _H[6], _H[7]
+
+    for t in range(64):
+        e1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g)
+        temp1 = (h + e1 + ch + _K[t] + w[t]) & _MASK32
+        e0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = (e0 + maj) & _MASK32
+
+        h = g
+        g = f
+        f = e
+        e = (d + temp1) & _MASK32
+        d = c
+        c = b
+        b = a
+        a = (temp1 + temp2) & _MASK32
+
+    # Only the first digest word is needed for the prefix check
+    return (_H[0] + a) & _MASK32
+
+
+@njit(cache=True, nogil=True)
+def find_proof(last_proof: int, start: int = 0, stride: int = 1, limit: int = 0) -> int:
+    """
+    Finds a proof p' such that hash(last_proof, p') has 4 leading hex zeroes
+
+    The optional parameters let parallel workers each scan a disjoint
+    stripe of the nonce space in bounded batches.
+
+    Parameters:
+        last_proof (int): Previous Proof (p)
+        start (int): First candidate nonce to try
+        stride (int): Step between candidate nonces
+        limit (int): Maximum attempts before giving up; 0 means unbounded
+
+    Returns:
+        int: New Proof (p'), or -1 if limit attempts were exhausted
+    """
+    # The message is at most 40 digits, so one padded block always suffices
+    block = np.zeros(64, dtype=np.uint8)
+
+    # The constant prefix is written once, outside the loop
+    prefix_end = _write_digits(block, 0, last_proof)
+
+    proof = start
+    attempts = 0
+
+    while True:
+        # Append the nonce digits and the FIPS-180 padding
+        end = _write_digits(block, prefix_end, proof)
+        block[end] = 0x80
+
+        for i in range(end + 1, 62):
+            block[i] = 0
+
+        # Message bit length, big-endian in the last 8 bytes
+        bit_length = end * 8
+        block[62] = (bit_length >> 8) & 0xFF
+        block[63] = bit_length & 0xFF
+
+        # 4 leading hex zeroes means the top 16 bits of the digest are 0
+        if (_sha256_first_word(block) >> 16) == 0:
+            return proof
+
+        proof += stride
+        attempts += 1
+
+        if limit != 0 and attempts >= limit:
+            return -1
+
+
+# Force compilation at import (served from the on-disk cache after the
+# first run), so the first mining request never pays the JIT latency
+find_proof(0, 0, 1, 1)
@@ -1,8 +1,15 @@
+import os
+import queue
+import threading
+from collections.abc import Iterator
+from time import sleep
 from typing import Literal
 from uuid import uuid4
 
-from blockchain import Block, Blockchain, BlockDict, TransactionDict
-from flask import Flask, jsonify, request
+import msgspec
+import orjson
+from blockchain import Block, Blockchain, TransactionDict
+from flask import Flask, request
 from flask.wrappers import Response
 
 # from textwrap import dedent
@@ -11,8 +18,9 @@ from flask_cors import CORS
 # Instantiate the blockchain
 blockchain = Blockchain()
 
-# Generate a globally unique address for this node
-node_identifier: str = str(object=uuid4()).replace("-", "")
+# Generate a globally unique address for this node; .hex is the
+# dash-free form straight from the uuid module, no str/replace churn
+node_identifier: str = uuid4().hex
 
 # Instantiate the server
 app = Flask(import_name=__name__)
@@ -21,90 +29,332 @@ app = Flask(import_name=__name__)
 CORS(app=app)
 
 
-@app.route(rule="/mine", methods=["GET"])
-def mine() -> tuple[Response, Literal[200]]:
-    # Get the last block
-    last_block: Block = blockchain.last_block
+def _json(payload: dict) -> Response:
+    """
+    Serializes a payload to a JSON Response with orjson
 
-    # Get the proof of the last block
-    last_proof: int = last_block.proof
+    orjson writes bytes directly and is several times faster than the
+    stdlib encoder jsonify goes through, so every route returns through
+    this helper instead.
 
-    # Find the proof for the new block
-    proof: int = blockchain.proof_of_work(last_proof=last_proof)
+    Parameters:
+        payload (dict): JSON-serializable response payload
 
-    # A reward must be issued to the miner
-    blockchain.new_transaction(
-        sender="0",  # Sender is "0" to signify that this node has mined a new block
-        recipient=node_identifier,  # Recipient is the node identifier
-        amount=1,  # Reward
-    )
+    Returns:
+        Response: The JSON response
+    """
+    return Response(response=orjson.dumps(payload), mimetype="application/json")
 
-    # Get the hash of the last block
-    previous_hash: str = blockchain.hash(block=last_block)
 
-    # Create a new block
-    block: Block = blockchain.new_block(proof=proof, previous_hash=previous_hash)
+class TxnIn(msgspec.Struct):
+    """
+    Incoming transaction payload
 
-    # Convert the block to a dictionary
-    formatted_block: BlockDict = block.to_dict()
+    Field presence and types are checked by msgspec while the request
+    body is being parsed, replacing the Python-level field loop.
 
-    response: dict[str, str | int | float | list[TransactionDict] | None] = {
-        "message": "New Block Forged",
-        "index": formatted_block.get("index"),
-        "transactions": formatted_block.get("transactions"),
-        "proof": formatted_block.get("proof"),
-        "previous_hash": formatted_block.get("previous_hash"),
-    }
+    Attributes:
+        sender (str): Address of the sender
+        recipient (str): Address of the recipient
+        amount (int): Transaction amount
+    """
 
-    return jsonify(response), 200
+    sender: str
+    recipient: str
+    amount: int
 
 
-@app.route(rule="/transactions/new", methods=["POST"])
-def new_transaction() -> tuple[Response, Literal[201] | Literal[400]]:
-    # Get the request payload
-    payload: dict[str, str | int] = request.get_json()
+# Precompiled decoder; validation happens during the parse itself
+_txn_decoder = msgspec.json.Decoder(type=TxnIn)
+
+# Byte template for the success response; only the block index varies,
+# so the body is two constant chunks around the formatted integer
+_TXN_OK_PREFIX: bytes = b'{"message":"Transaction will be added to Block '
+_TXN_OK_SUFFIX: bytes = b'."}'
 
-    # Check if all the required fields are present
-    required: list[str] = ["sender", "recipient", "amount"]
-    for field in required:
+# Pre-encoded 400 bodies for each missing transaction field, built once
+# at import so the error path is a lookup instead of an f-string
+# evaluation, dict build and JSON encode per request
+_MISSING_FIELD_BODY: dict[str, bytes] = {
+    field: orjson.dumps(
+        {
+            "message": (
+                "amount" if field == "amount" else f"{field}s address"
+            )
+            + " is required."
+        }
+    )
+    for field in ("sender", "recipient", "amount")
+}
+
+
+def _invalid_transaction(body: bytes) -> tuple[Response, Literal[400]]:
+    """
+    Builds the 400 response for a rejected transaction payload
+
+    Only runs on the error path; re-parses the body leniently to name
+    the first missing field, matching the original error messages.
+
+    Parameters:
+        body (bytes): Raw request body
+
+    Returns:
+        tuple[Response, Literal[400]]: The error response
+    """
+    try:
+        payload: dict = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        payload = {}
+
+    if not isinstance(payload, dict):
+        payload = {}
+
+    for field in ("sender", "recipient", "amount"):
         if not payload.get(field):
             return (
-                jsonify(
-                    {
-                        "message": f"{f'{field}s address' if field != 'amount' else field} is required."
-                    }
+                Response(
+                    response=_MISSING_FIELD_BODY[field],
+                    mimetype="application/json",
                 ),
                 400,
             )
 
+    # Fields are present but of the wrong type
+    return _json(payload={"message": "Invalid transaction payload."}), 400
+
+
+class Miner(threading.Thread):
+    """
+    Background mining worker
+
+    Continuously mines on top of the current chain tip and parks the
+    finished proof in a one-slot queue, so /mine hands out a pre-mined
+    proof instead of occupying a request worker for the whole search.
+
+    Attributes:
+        queue (queue.Queue): One-slot queue of (last_proof, proof) results
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.queue: queue.Queue[tuple[int, int]] = queue.Queue(maxsize=1)
+
+    def run(self) -> None:
+        while True:
+            # Mine on top of the current tip
+            tip: Block = blockchain.last_block
+            proof: int = blockchain.proof_of_work(last_proof=tip.proof)
+
+            # Parks here until /mine consumes the result
+            self.queue.put((tip.proof, proof))
+
+            # Wait for the tip to advance before mining the next block
+            while blockchain.last_block is tip:
+                sleep(0.05)
+
+
+# Created at import but started lazily by the first /mine request, so a
+# process that merely imports this module (a preloading gunicorn master,
+# a test harness) never runs a miner of its own
+miner = Miner()
+
+# Guards miner start/replacement against concurrent first requests
+_miner_lock = threading.Lock()
+
+
+def _ensure_miner() -> Miner:
+    """
+    Returns this process's running Miner, starting one if needed
+
+    Threads do not survive fork(), so a worker forked after the miner
+    started (gunicorn with preload_app) inherits a dead Miner whose
+    queue will never fill again; a dead-but-started miner is replaced
+    with a fresh one, since a thread cannot be restarted.
+
+    Returns:
+        Miner: The live background miner for this process
+    """
+    global miner
+
+    with _miner_lock:
+        if not miner.is_alive():
+            if miner.ident is not None:
+                # Leftover from the parent process; build a fresh one
+                miner = Miner()
+
+            miner.start()
+
+        return miner
+
+
+# Mining reward constants, fixed for the life of the process
+_REWARD_SENDER: str = "0"  # "0" signifies that this node mined a new block
+_REWARD_AMOUNT: int = 1
+
+# Serializes the whole forge sequence in /mine. Blockchain's own lock
+# keeps each individual append consistent, but claiming a proof, reading
+# the tip and sealing the block must not interleave across threads, or
+# two concurrent requests forge siblings of the same parent and leave
+# the chain permanently invalid. Consensus takes the same lock before
+# swapping in an adopted chain, for the same reason.
+_forge_lock = threading.Lock()
+
+
+@app.route(rule="/mine", methods=["GET"])
+def mine() -> tuple[Response, Literal[200]]:
+    with _forge_lock:
+        # Take the proof the background miner already found
+        mined_for, proof = _ensure_miner().queue.get()
+
+        # Read the tip after claiming the proof; under the forge lock
+        # nothing else forges ahead of us before the block is sealed
+        last_block: Block = blockchain.last_block
+
+        # If the tip moved since the proof was mined (e.g. consensus
+        # replaced the chain), it is stale; mine synchronously against
+        # the current tip
+        if mined_for != last_block.proof:
+            proof = blockchain.proof_of_work(last_proof=last_block.proof)
+
+        # A reward must be issued to the miner; the fields are precomputed
+        # constants, passed positionally to skip the keyword binding
+        blockchain.new_transaction(_REWARD_SENDER, node_identifier, _REWARD_AMOUNT)
+
+        # Get the hash of the last block
+        previous_hash: str = blockchain.hash(block=last_block)
+
+        # Create a new block
+        block: Block = blockchain.new_block(proof=proof, previous_hash=previous_hash)
+
+        # Keep the running chain length current; the new block's index is
+        # by construction the new length
+        global _chain_length
+        _chain_length = block.index
+
+    # Splice the block's fields into the response directly instead of
+    # re-reading them one .get() at a time; this also carries the
+    # timestamp along, which clients are free to ignore
+    response: dict[str, str | int | float | list[TransactionDict]] = {
+        "message": "New Block Forged",
+        **block.to_dict(),
+    }
+
+    return _json(payload=response), 200
+
+
+@app.route(rule="/transactions/new", methods=["POST"])
+def new_transaction() -> tuple[Response, Literal[201] | Literal[400]]:
+    # Parse and validate the body in one pass, skipping Flask's get_json
+    body: bytes = request.get_data(cache=False)
+
+    try:
+        txn: TxnIn = _txn_decoder.decode(body)
+    except msgspec.DecodeError:
+        return _invalid_transaction(body=body)
+
+    # Empty addresses and zero amounts are rejected like missing fields
+    if not (txn.sender and txn.recipient and txn.amount):
+        return _invalid_transaction(body=body)
+
     # Create a new transaction
     index: int = blockchain.new_transaction(
-        sender=payload.get("sender"),  # type: ignore
-        recipient=payload.get("recipient"),  # type: ignore
-        amount=payload.get("amount"),  # type: ignore
+        sender=txn.sender,
+        recipient=txn.recipient,
+        amount=txn.amount,
     )
 
-    response: dict[str, str] = {
-        "message": f"Transaction will be added to Block {index}."
-    }
+    # Splice the index into the pre-encoded body template; no dict or
+    # JSON encoding on the success path
+    return (
+        Response(
+            response=_TXN_OK_PREFIX + b"%d" % index + _TXN_OK_SUFFIX,
+            mimetype="application/json",
+        ),
+        201,
+    )
 
-    return jsonify(response), 201
 
+# Running chain length, updated at the two places the chain can change
+# (mining a block, consensus adopting a longer chain), so the hot /chain
+# path reads a module global instead of measuring the list per request
+_chain_length: int = len(blockchain.chain)
 
-@app.route(rule="/chain", methods=["GET"])
-def full_chain() -> tuple[Response, Literal[200]]:
-    response: dict[str, list[BlockDict] | int] = {
-        "chain": [block.to_dict() for block in blockchain.chain],
-        "length": len(blockchain.chain),
-    }
+# Cached /chain response body and the chain length it was built for.
+# Length is a safe key: mining appends and consensus only adopts strictly
+# longer chains, so any change to the chain changes its length.
+_chain_cache: tuple[int, bytes] = (0, b"")
+
+
+def _stream_chain(length: int) -> Iterator[bytes]:
+    """
+    Yields the /chain payload one block at a time
+
+    Peak memory stays at one block's JSON and the first byte goes out
+    after a single block is serialized, instead of materializing the
+    whole body up front; per-block bytes still come from each block's
+    memo. The assembled body is stored in the cache on completion so
+    later requests can send it as one chunk.
+
+    Parameters:
+        length (int): Chain length this stream represents
+
+    Returns:
+        Iterator[bytes]: Chunks of the JSON body
+    """
+    global _chain_cache
+
+    chunks: list[bytes] = []
+
+    def emit(chunk: bytes) -> bytes:
+        chunks.append(chunk)
+        return chunk
+
+    yield emit(b'{"chain":[')
 
-    return jsonify(response), 200
+    # Slice to the requested length in case blocks land mid-stream
+    for position, block in enumerate(blockchain.chain[:length]):
+        if position:
+            yield emit(b",")
+        yield emit(block.to_json_bytes())
+
+    yield emit(b'],"length":' + str(length).encode() + b"}")
+
+    _chain_cache = (length, b"".join(chunks))
+
+
+@app.route(rule="/chain", methods=["GET"])
+def full_chain() -> tuple[Response, Literal[200] | Literal[304]]:
+    # The chain only changes when its length does, so the length is a
+    # valid ETag; clients polling between blocks get an empty 304
+    etag: str = f'"{_chain_length}"'
+
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304), 304
+
+    # Steady state is one dict lookup and a Response wrap around the
+    # cached bytes; the first request after a new block streams the body
+    # block-by-block and refills the cache on the way out
+    length: int = _chain_length
+    cached_length, body = _chain_cache
+
+    return (
+        Response(
+            response=body if cached_length == length else _stream_chain(length=length),
+            mimetype="application/json",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        ),
+        200,
+    )
 
 
 @app.route(rule="/nodes/register", methods=["POST"])
 def register_nodes() -> tuple[Response, Literal[201] | Literal[400]]:
-    # Get the request payload
-    payload: dict[str, list[str] | None] = request.get_json()
+    # Get the request payload; skip caching the parse on the request
+    # object, and treat a malformed body like a missing one instead of
+    # paying for a raised exception
+    payload: dict[str, list[str] | None] = (
+        request.get_json(cache=False, silent=True) or {}
+    )
 
     # Get the nodes
     nodes: list[str] | None = payload.get("nodes")
@@ -112,7 +362,7 @@ def register_nodes() -> tuple[Response, Literal[201] | Literal[400]]:
     # Check if the nodes are valid
     if nodes is None:
         return (
-            jsonify({"message": "No node(s) provided."}),
+            _json(payload={"message": "No node(s) provided."}),
             400,
         )
 
@@ -122,21 +372,40 @@ def register_nodes() -> tuple[Response, Literal[201] | Literal[400]]:
 
     response: dict[str, str] = {"message": "New nodes have been added."}
 
-    return jsonify(response), 201
+    return _json(payload=response), 201
 
 
 @app.route(rule="/nodes/resolve", methods=["GET"])
 def consensus() -> tuple[Response, Literal[200]]:
-    # Result of the consensus
-    replaced: bool = blockchain.resolve_conflicts()
+    # A chain swap must not land between /mine's staleness check and its
+    # new_block, or the forged block links to the replaced tip; holding
+    # the forge lock keeps the swap and the forge sequence disjoint
+    with _forge_lock:
+        # Result of the consensus
+        replaced: bool = blockchain.resolve_conflicts()
+
+        if replaced:
+            # The adopted chain is longer; update the running length
+            global _chain_length
+            _chain_length = len(blockchain.chain)
 
     if replaced:
         response: dict[str, str] = {"message": "Our chain was replaced."}
     else:
         response: dict[str, str] = {"message": "Our chain is authoritative."}
 
-    return jsonify(response), 200
+    return _json(payload=response), 200
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    if os.environ.get("DEV_SERVER"):
+        # Werkzeug's dev server, threaded so one long /mine request does
+        # not stall every other endpoint; opt-in for debugging only
+        app.run(host="0.0.0.0", port=5000, threaded=True)
+    else:
+        # Production WSGI server with a thread pool in a single process,
+        # so all threads share one coherent chain. For multi-process
+        # deployment, see gunicorn_conf.py.
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=5000, threads=8)